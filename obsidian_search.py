@@ -1,14 +1,57 @@
 #!/usr/bin/env python3
 import os
 import argparse
+import atexit
+import codecs
+import html
+import hashlib
+import heapq
+import pickle
+import re
+import signal
+import sys
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from urllib.parse import quote
-from flask import Flask, request, jsonify, render_template_string, abort
+from flask import Flask, Response, request, jsonify, abort
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
+
+try:
+    import orjson
+except ImportError:  # optional speedup; Flask's stdlib json provider is used without it
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (large search results encode several times faster)."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+# Memoizes /api/search responses per index generation and query string (see search_cache_key)
+cache = Cache(app, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 60})
 
 # ---------------- Config (module-level defaults; can be overridden by env/CLI) ----------------
 BROWSE_ROOT = os.path.abspath(os.environ.get("BROWSE_ROOT", os.path.expanduser("~")))
+BROWSE_ROOT_RESOLVED = str(Path(BROWSE_ROOT).resolve(strict=False))  # recomputed if --browse-root overrides it
 ALLOW_ANY_PATH = os.environ.get("ALLOW_ANY_PATH", "0") == "1"
 
 # Obsidian deep-link configuration
@@ -17,10 +60,59 @@ OBSIDIAN_HOST_PREFIX = os.path.normpath(os.environ.get("OBSIDIAN_HOST_PREFIX", "
 # If you know your Obsidian vault display name, set this and we’ll use vault+file deep links.
 OBSIDIAN_VAULT_NAME = os.environ.get("OBSIDIAN_VAULT_NAME", "")
 
+# Where built indexes are persisted between runs (one file per vault); empty disables caching
+INDEX_CACHE_DIR = os.environ.get("INDEX_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "obsidian-search"))
+INDEX_CACHE_VERSION = 5  # bump when the persisted note format changes
+# Seconds between background checks of the loaded vault for added/changed/deleted notes; 0 disables
+REINDEX_INTERVAL = float(os.environ.get("REINDEX_INTERVAL", "5"))
+
 # ---------------- In-memory state ----------------
-INDEX = []   # list[(doc_id, text)]
-DOCS = {}    # doc_id -> {title, content, path, rel_path}
+# Per-note columns indexed by doc_id (struct-of-arrays); a deleted note keeps its slot with PATHS[doc_id] = None
+TITLES = []          # note title (file name without .md)
+TITLES_LOWER = []    # lowercased titles, precomputed for search
+PATHS = []           # absolute (container-visible) paths
+REL_PATHS = []       # paths relative to the vault
+STAMPS = []          # (mtime_ns, size) when the note was read
+HASHES = []          # sha256 digest of the note's bytes, to tell real edits from touched files
+CONTENTS_LOWER = []  # lowercased content as UTF-8 bytes (see read_note)
+URLS = []            # obsidian:// deep links, built once per note since they only depend on startup config
+TOKENS = {}  # lowercased word token -> set(doc_id) (packed bytes until first used), for narrowing searches
+VOCAB = None  # "\n"-delimited TOKENS keys, built lazily for partial-word lookups; None when stale
 VAULT_PATH = None  # absolute path to selected vault (container-visible if in Docker)
+INDEX_GENERATION = 0  # bumped whenever the index is swapped or edited; part of every search cache key
+# Requests are served on separate threads: INDEX_LOCK guards reads/swaps of the state above,
+# CRAWL_LOCK lets only one (re)index run at a time without blocking searches meanwhile.
+INDEX_LOCK = threading.Lock()
+CRAWL_LOCK = threading.Lock()
+
+# Directory listings are returned in pages of this many entries by default
+LS_PAGE_SIZE = 500
+
+# /open streams notes from disk in chunks of this many bytes
+OPEN_CHUNK_SIZE = 64 * 1024
+
+# Folders never crawled for notes, besides hidden ones (.obsidian, .git, .trash, ...)
+SKIP_DIRS = {"node_modules", "Trash"}
+
+# Markdown reads are I/O bound, so overlap them across threads
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Notes modified more recently than this are left for the next re-index pass (debounces editor saves)
+REINDEX_SETTLE_NS = 1_000_000_000
+REINDEXER = None  # background re-index thread, started with the first vault
+
+# Re-index edits are written to the cache file at most this often (and on exit), not on every pass
+INDEX_SAVE_INTERVAL = 300
+INDEX_DIRTY = False  # the loaded index has edits not yet in its cache file
+INDEX_SAVED_AT = 0.0  # time.monotonic() of the last cache write
+
+# A partial word matching more vocabulary words than this narrows too little to beat a plain scan
+FRAGMENT_MAX_WORDS = 64
+
+
+TOKEN_RE = re.compile(r"\w+")
+# Search terms: "quoted phrases" or whitespace-separated keywords (stray quotes are dropped)
+QUERY_TERM_RE = re.compile(r'"([^"]+)"|([^\s"]+)')
 
 
 # ---------------- Helpers ----------------
@@ -28,41 +120,386 @@ def within_root(p: Path) -> bool:
     """If allow-any-path is enabled, all paths are allowed; otherwise restrict to BROWSE_ROOT."""
     if ALLOW_ANY_PATH:
         return True
+    return _within_root_str(str(p))
+
+
+@lru_cache(maxsize=8192)
+def _within_root_str(p: str) -> bool:
+    root = BROWSE_ROOT_RESOLVED
     try:
-        return os.path.commonpath([p.resolve(strict=False), Path(BROWSE_ROOT).resolve(strict=False)]) == str(
-            Path(BROWSE_ROOT).resolve(strict=False)
-        )
+        return os.path.commonpath([str(Path(p).resolve(strict=False)), root]) == root
     except Exception:
         return False
 
 
-def crawl_obsidian_vault(folder_path: str):
-    """Index all .md files under folder_path."""
-    index = []
-    docs = {}
-    doc_id = 0
-    for root, _, files in os.walk(folder_path):
-        for file in files:
-            if not file.lower().endswith(".md"):
+def iter_markdown_files(folder_path: str):
+    """
+    Yield paths of all .md files under folder_path (scandir-based, no per-entry stat),
+    without descending into hidden folders or SKIP_DIRS.
+    """
+    try:
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith(".") and entry.name not in SKIP_DIRS:
+                            yield from iter_markdown_files(entry.path)
+                    elif entry.name.lower().endswith(".md") and entry.is_file():
+                        yield entry.path
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+
+def read_note(path: str, known_digest: bytes = None):
+    """
+    Read a note and return (sha256 digest, lowercased text as UTF-8 bytes), the latter
+    being the only copy of the content kept in memory ((None, b"") if it can't be read).
+    Lowercasing is done on the decoded text so non-ASCII letters fold too; a UTF-8
+    substring match equals a str match. If the digest equals known_digest the file was
+    only touched (e.g. by a sync tool), so the content is returned as None, unprocessed.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except Exception:
+        return None, b""
+    digest = hashlib.sha256(data).digest()
+    if digest == known_digest:
+        return digest, None
+    return digest, data.decode("utf-8", errors="ignore").lower().encode("utf-8")
+
+
+def file_stamp(path: str):
+    """Return (mtime_ns, size) for path, used to detect changed notes; None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def crawl_obsidian_vault(folder_path: str, cached=None):
+    """
+    Index all .md files under folder_path.
+    `cached` is a (columns, tokens) pair from load_index_cache: only notes whose stamp
+    changed are read, only those whose bytes changed are re-tokenized, and their postings
+    are patched in place, so reopening an unchanged vault does no per-note work.
+    Returns (columns, tokens, changed) where columns is
+    (titles, titles_lower, paths, rel_paths, stamps, hashes, contents_lower, urls) and
+    changed tells whether anything differs from `cached`.
+    """
+    if cached:
+        columns, tokens = cached
+        # Links depend on startup config, so they are rebuilt rather than persisted
+        urls = [build_obsidian_url(path, rel_path, folder_path) if path else None
+                for path, rel_path in zip(columns[2], columns[3])]
+        columns = (*columns, urls)
+    else:
+        columns, tokens = ([], [], [], [], [], [], [], []), {}
+    known, changed, removed = scan_vault_changes(folder_path, columns)
+    apply_vault_changes(folder_path, columns, tokens, known, changed, removed)
+    return columns, tokens, bool(changed or removed)
+
+
+def scan_vault_changes(vault_path: str, columns, settle: bool = False):
+    """
+    Compare the .md files under vault_path with an index's columns and read the notes that
+    changed. Returns (known, changed, removed): known maps rel_path -> doc_id, changed lists
+    (path, rel_path, stamp, digest, content_lower) with content_lower None when only the stamp
+    moved, and removed lists the doc ids of notes gone from disk. With `settle`, notes modified
+    within REINDEX_SETTLE_NS are left for a later pass (debounces editor saves).
+    """
+    _, _, _, rel_paths, stamps, hashes, _, _ = columns
+    known = {rel_path: doc_id for doc_id, rel_path in enumerate(rel_paths) if rel_path is not None}
+
+    seen, stale = set(), []
+    now_ns = time.time_ns()
+    for path in iter_markdown_files(vault_path):
+        rel_path = os.path.relpath(path, vault_path)
+        seen.add(rel_path)
+        stamp = file_stamp(path)
+        if settle and (stamp is None or 0 <= now_ns - stamp[0] < REINDEX_SETTLE_NS):
+            continue  # vanished or still being written; look again next pass (future mtimes don't wait)
+        if stamp is None or rel_path not in known or stamps[known[rel_path]] != stamp:
+            stale.append((path, rel_path, stamp))
+    removed = [known[rel_path] for rel_path in known.keys() - seen]
+
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        reads = pool.map(read_note, [path for path, _, _ in stale],
+                         [hashes[known[rel_path]] if rel_path in known else None for _, rel_path, _ in stale])
+        changed = [(path, rel_path, stamp, digest, content_lower)
+                   for (path, rel_path, stamp), (digest, content_lower) in zip(stale, reads)]
+    return known, changed, removed
+
+
+def apply_vault_changes(vault_path: str, columns, tokens: dict, known: dict, changed: list, removed: list) -> bool:
+    """
+    Patch columns and tokens in place with the result of scan_vault_changes.
+    Returns True if any note's content changed (False when only stamps moved).
+    """
+    edited = bool(removed)
+    for doc_id in removed:
+        _drop_postings(columns, tokens, doc_id)
+        # Keep the slot so doc ids stay stable; /open and search skip deleted notes
+        _store_note(columns, doc_id, None, None, None, None, b"", vault_path)
+    for path, rel_path, stamp, digest, content_lower in changed:
+        if content_lower is None:
+            columns[4][known[rel_path]] = stamp  # same bytes, only the stamp moved
+            continue
+        edited = True
+        doc_id = known.get(rel_path, len(columns[2]))
+        if rel_path in known:
+            _drop_postings(columns, tokens, doc_id)
+        _store_note(columns, doc_id, path, rel_path, stamp, digest, content_lower, vault_path)
+        for token in note_tokens(columns[1][doc_id], content_lower):
+            postings = token_postings(tokens, token)
+            if postings is None:
+                tokens[token] = {doc_id}
+            else:
+                postings.add(doc_id)
+    return edited
+
+
+def note_title(path: str) -> str:
+    """Display title of a note: its file name without the .md extension."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def note_tokens(title_lower: str, content_lower: bytes) -> set:
+    """Word tokens of a note's lowercased title and content (its TOKENS postings)."""
+    return set(TOKEN_RE.findall(content_lower.decode("utf-8"))).union(TOKEN_RE.findall(title_lower))
+
+
+def query_terms(q: str) -> list:
+    """Split a lowercased query into its terms; a note matches when it contains every term."""
+    terms = (phrase.strip() or word for phrase, word in QUERY_TERM_RE.findall(q))
+    return list(dict.fromkeys(term for term in terms if term))
+
+
+def token_postings(tokens: dict, token: str):
+    """
+    Doc ids containing token, or None. Postings loaded from the index cache stay packed
+    until first used, so reopening a vault doesn't rebuild millions of set entries up front.
+    """
+    postings = tokens.get(token)
+    if isinstance(postings, bytes):
+        postings = tokens[token] = set(array("i", postings))
+    return postings
+
+
+def candidate_docs(q: str):
+    """
+    Narrow a lowercased substring query to the set of doc ids that can match, using TOKENS.
+    Word tokens strictly inside the query must occur whole in a matching note; a token
+    touching either end of the query may be part of a longer word, so those are matched
+    against the vocabulary. Returns None when the query has no word characters or every
+    token is too common a fragment to narrow anything (the caller then scans all notes).
+    """
+    candidates = None
+    for m in TOKEN_RE.finditer(q):
+        token = m.group()
+        open_start, open_end = m.start() == 0, m.end() == len(q)
+        if open_start or open_end:
+            needle = ("" if open_start else "\n") + token + ("" if open_end else "\n")
+            postings = fragment_postings(needle)
+            if postings is None:
                 continue
-            path = os.path.join(root, file)
-            try:
-                text = Path(path).read_text(encoding="utf-8", errors="ignore")
-            except Exception:
-                text = ""
-            title = os.path.splitext(file)[0]
-            rel_path = os.path.relpath(path, folder_path)
-            docs[doc_id] = {
-                "title": title,
-                "content": text,
-                "path": str(Path(path).resolve()),
-                "rel_path": rel_path
-            }
-            index.append((doc_id, text))
-            doc_id += 1
-    return index, docs
+        else:
+            postings = token_postings(TOKENS, token) or set()
+        candidates = set(postings) if candidates is None else candidates & postings
+        if not candidates:
+            break
+    return candidates
+
 
+def fragment_postings(needle: str):
+    """
+    Union of the postings of the vocabulary words containing needle, or None when it spans
+    more than FRAGMENT_MAX_WORDS words or more postings than there are notes: merging that
+    many sets costs more than the scan it would save.
+    """
+    words = list(islice(vocabulary_matches(needle), FRAGMENT_MAX_WORDS + 1))
+    if len(words) > FRAGMENT_MAX_WORDS:
+        return None
+    postings = [token_postings(TOKENS, word) for word in words]
+    if sum(map(len, postings)) > len(PATHS):
+        return None
+    return set().union(*postings)
+
+
+def vocabulary_matches(needle: str):
+    """
+    Yield the vocabulary words containing needle, where a leading/trailing "\n" anchors
+    it to the start/end of a word. The whole vocabulary is one newline-delimited string,
+    so this is a single C-level str.find scan instead of a Python loop over every word.
+    """
+    global VOCAB
+    if VOCAB is None:
+        VOCAB = "\n" + "\n".join(TOKENS) + "\n"
+    skip = 1 if needle.startswith("\n") else 0
+    pos = VOCAB.find(needle)
+    while pos != -1:
+        start = VOCAB.rfind("\n", 0, pos + skip) + 1
+        end = VOCAB.find("\n", pos + skip)
+        yield VOCAB[start:end]
+        pos = VOCAB.find(needle, end)
+
+
+def index_cache_file(vault_path: str):
+    """Per-vault cache file under INDEX_CACHE_DIR, or None if caching is disabled."""
+    if not INDEX_CACHE_DIR:
+        return None
+    key = hashlib.sha1(vault_path.encode("utf-8")).hexdigest()
+    return os.path.join(INDEX_CACHE_DIR, f"{key}.pickle")
+
+
+def load_index_cache(vault_path: str):
+    """
+    Load a vault's persisted index as (columns, tokens), columns being
+    (titles, titles_lower, paths, rel_paths, stamps, hashes, contents_lower); None if missing or unreadable.
+    """
+    cache_file = index_cache_file(vault_path)
+    if not cache_file:
+        return None
+    try:
+        with open(cache_file, "rb") as f:
+            data = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(data, dict) or data.get("version") != INDEX_CACHE_VERSION or data.get("vault") != vault_path:
+        return None
+    return data["columns"], data["tokens"]
+
+
+def save_index_cache(vault_path: str, columns, tokens: dict):
+    """Persist a vault's index columns (minus the derived links) and postings, replacing the file atomically."""
+    cache_file = index_cache_file(vault_path)
+    if not cache_file:
+        return
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    packed = {token: postings if isinstance(postings, bytes) else array("i", postings).tobytes()
+              for token, postings in tokens.items()}
+    data = {"version": INDEX_CACHE_VERSION, "vault": vault_path, "columns": tuple(columns[:7]), "tokens": packed}
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"[warn] Could not write index cache {cache_file}: {e}")
+
+
+def refresh_vault():
+    """
+    Bring the loaded vault's index up to date with the files on disk, patching
+    the note columns and TOKENS in place for added, modified and deleted notes only.
+    """
+    global VOCAB, INDEX_DIRTY, INDEX_GENERATION
+    with CRAWL_LOCK:
+        vault_path = VAULT_PATH
+        if not vault_path:
+            return
+        # Only CRAWL_LOCK holders mutate the index, so it can be read here without INDEX_LOCK
+        columns = (TITLES, TITLES_LOWER, PATHS, REL_PATHS, STAMPS, HASHES, CONTENTS_LOWER, URLS)
+        known, changed, removed = scan_vault_changes(vault_path, columns, settle=True)
+        if changed or removed:
+            with INDEX_LOCK:
+                if VAULT_PATH != vault_path:
+                    return
+                edited = apply_vault_changes(vault_path, columns, TOKENS, known, changed, removed)
+                if edited:
+                    VOCAB = None
+                    INDEX_GENERATION += 1
+                    cache.clear()  # frees the old generation's hits; they can no longer be looked up
+            # Touched-only notes just move stamps; they ride along with the next real save
+            INDEX_DIRTY = INDEX_DIRTY or edited
+        flush_index_cache()
+
+
+def flush_index_cache(force: bool = False):
+    """
+    Write the loaded vault's index to its cache file if it has unsaved edits, at most
+    once per INDEX_SAVE_INTERVAL unless forced. Caller holds CRAWL_LOCK.
+    """
+    global INDEX_DIRTY, INDEX_SAVED_AT
+    if not INDEX_DIRTY or not VAULT_PATH:
+        return
+    if not force and time.monotonic() - INDEX_SAVED_AT < INDEX_SAVE_INTERVAL:
+        return
+    save_index_cache(VAULT_PATH, (TITLES, TITLES_LOWER, PATHS, REL_PATHS, STAMPS, HASHES, CONTENTS_LOWER, URLS), TOKENS)
+    INDEX_DIRTY, INDEX_SAVED_AT = False, time.monotonic()
+
+
+@atexit.register
+def _flush_on_exit():
+    with CRAWL_LOCK:
+        flush_index_cache(force=True)
+
+
+def _store_note(columns, doc_id: int, path, rel_path, stamp, digest, content_lower: bytes, vault_path: str):
+    """Write one note's row into columns, appending when doc_id is new; a None path marks it deleted."""
+    titles, titles_lower, paths, rel_paths, stamps, hashes, contents_lower, urls = columns
+    if doc_id == len(paths):
+        for column in columns:
+            column.append(None)
+    title = note_title(path) if path else None
+    abs_path = str(Path(path).resolve()) if path else None
+    titles[doc_id] = title
+    titles_lower[doc_id] = title.lower() if title else ""
+    paths[doc_id] = abs_path
+    rel_paths[doc_id] = rel_path
+    stamps[doc_id] = stamp
+    hashes[doc_id] = digest
+    contents_lower[doc_id] = content_lower
+    urls[doc_id] = build_obsidian_url(abs_path, rel_path, vault_path) if path else None
+
+
+def _drop_postings(columns, tokens: dict, doc_id: int):
+    """Remove a note from the token postings."""
+    for token in note_tokens(columns[1][doc_id], columns[6][doc_id]):
+        postings = token_postings(tokens, token)
+        if postings is not None:
+            postings.discard(doc_id)
+            if not postings:
+                del tokens[token]
 
+
+def _reindex_loop():
+    while True:
+        time.sleep(REINDEX_INTERVAL)
+        try:
+            refresh_vault()
+        except Exception as e:
+            print(f"[warn] Background re-index failed: {e}")
+
+
+def start_reindexer():
+    """Start the background re-index thread once (no-op when REINDEX_INTERVAL is 0). Caller holds CRAWL_LOCK."""
+    global REINDEXER
+    if REINDEX_INTERVAL <= 0 or REINDEXER is not None:
+        return
+    REINDEXER = threading.Thread(target=_reindex_loop, name="reindexer", daemon=True)
+    REINDEXER.start()
+
+
+def entry_is_dir(entry: os.DirEntry) -> bool:
+    """DirEntry.is_dir() (uses the cached d_type; only symlinks cost a stat), False on error."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def entry_real_path(entry: os.DirEntry) -> str:
+    """Real path of an entry scanned from a resolved directory; only symlinks need resolving."""
+    if entry.is_symlink():
+        return str(Path(entry.path).resolve(strict=False))
+    return entry.path
+
+
+@lru_cache(maxsize=4096)
 def system_root_for(path: Path) -> Path:
     """Return filesystem root for a given path (handles Windows drive roots safely)."""
     p = path.resolve(strict=False)
@@ -72,6 +509,7 @@ def system_root_for(path: Path) -> Path:
     return Path("/")
 
 
+@lru_cache(maxsize=8192)
 def map_container_to_host(abs_path: str) -> str:
     """
     Map a container path (e.g., /vault/Notes/Foo.md) to the host path
@@ -89,20 +527,21 @@ def map_container_to_host(abs_path: str) -> str:
     return abs_path
 
 
-def build_obsidian_url(meta: dict) -> str:
+def build_obsidian_url(path: str, rel_path: str, vault_path: str) -> str:
     """
     Prefer vault+file form when OBSIDIAN_VAULT_NAME is set.
     Otherwise use path= with a mapped host path.
+    Both path and vault_path are expected to be resolved already.
     """
-    if OBSIDIAN_VAULT_NAME and VAULT_PATH:
+    if OBSIDIAN_VAULT_NAME and vault_path:
         try:
-            rel = Path(meta["path"]).resolve().relative_to(Path(VAULT_PATH).resolve())
+            rel = Path(path).relative_to(vault_path)
             rel_posix = rel.as_posix()
         except Exception:
-            rel_posix = Path(meta.get("rel_path") or os.path.basename(meta["path"])).as_posix()
+            rel_posix = Path(rel_path or os.path.basename(path)).as_posix()
         return f"obsidian://open?vault={quote(OBSIDIAN_VAULT_NAME)}&file={quote(rel_posix)}"
     else:
-        host_path = map_container_to_host(meta["path"])
+        host_path = map_container_to_host(path)
         return f"obsidian://open?path={quote(host_path)}"
 
 
@@ -195,7 +634,7 @@ PAGE = r"""
         <div class="muted">Results open in <strong>Obsidian</strong> via obsidian:// links<span class="pill">fallback: browser</span></div>
       </div>
       <div class="row">
-        <input id="q" type="text" placeholder="Search title or content…">
+        <input id="q" type="text" placeholder='Search title or content… (all words must match; "quote" exact phrases)'>
         <button class="primary" onclick="doSearch()">Search</button>
       </div>
       <div id="searchMeta" class="muted" style="margin-top:8px;"></div>
@@ -220,12 +659,26 @@ function switchTab(which){
 
 function refresh(){ listDir(currentPath); }
 
-async function listDir(path){
-  const res = await fetch(`/api/ls?path=${encodeURIComponent(path)}`);
+const PAGE_SIZE = 500;
+let listToken = 0;  // bumped on every fresh listing so stale "load more" pages are dropped
+
+// Fetch the next page when the "load more" sentinel at the bottom of the listing scrolls into view
+const moreObserver = new IntersectionObserver(entries=>{
+  entries.forEach(e=>{
+    if(!e.isIntersecting) return;
+    moreObserver.unobserve(e.target);
+    listDir(e.target.dataset.path, Number(e.target.dataset.offset));
+  });
+});
+
+async function listDir(path, offset=0){
+  const token = offset === 0 ? ++listToken : listToken;
+  const res = await fetch(`/api/ls?path=${encodeURIComponent(path)}&offset=${offset}&limit=${PAGE_SIZE}`);
   if(!res.ok){ alert('Failed to list directory'); return; }
   const data = await res.json();
-  renderBreadcrumb(data.breadcrumb);
-  renderListing(data);
+  if(token !== listToken) return;
+  if(offset === 0) renderBreadcrumb(data.breadcrumb);
+  renderListing(data, offset > 0);
 }
 
 function renderBreadcrumb(crumbs){
@@ -244,18 +697,22 @@ function renderBreadcrumb(crumbs){
   });
 }
 
-function renderListing(data){
+function renderListing(data, append=false){
   const cont = document.getElementById('listing');
-  cont.innerHTML='';
-  if(data.parent){
-    const up = document.createElement('div');
-    up.className='item';
-    up.textContent = '📁 ..';
-    up.onclick = ()=>{ currentPath = data.parent; listDir(currentPath); };
-    cont.appendChild(up);
-  }
-  if(data.dirs.length===0 && data.files.length===0){
-    const e=document.createElement('div'); e.className='empty'; e.textContent='(empty)'; cont.appendChild(e);
+  const more = document.getElementById('listMore');
+  if(more) more.remove();
+  if(!append){
+    cont.innerHTML='';
+    if(data.parent){
+      const up = document.createElement('div');
+      up.className='item';
+      up.textContent = '📁 ..';
+      up.onclick = ()=>{ currentPath = data.parent; listDir(currentPath); };
+      cont.appendChild(up);
+    }
+    if(data.total===0){
+      const e=document.createElement('div'); e.className='empty'; e.textContent='(empty)'; cont.appendChild(e);
+    }
   }
   data.dirs.forEach(d=>{
     const el = document.createElement('div');
@@ -270,6 +727,17 @@ function renderListing(data){
     el.textContent = '📄 ' + f.name;
     cont.appendChild(el);
   });
+  if(data.next_offset !== null){
+    const el = document.createElement('div');
+    el.id = 'listMore';
+    el.className = 'empty';
+    el.textContent = `Loading more… (${data.next_offset} of ${data.total})`;
+    el.dataset.path = data.path;
+    el.dataset.offset = data.next_offset;
+    cont.appendChild(el);
+    moreObserver.observe(el);
+  }
+  if(append) return;
 
   selectedPath = data.path;
   document.getElementById('chooseBtn').disabled = false;
@@ -324,6 +792,8 @@ async function doSearch(){
 listDir(currentPath);
 </script>
 """
+# Parsed and compiled once; home() only renders it
+PAGE_TEMPLATE = app.jinja_env.from_string(PAGE)
 
 # ---------------- Routes ----------------
 @app.route("/")
@@ -332,31 +802,38 @@ def home():
                   else "Browsing is limited to the configured root"
     browse_hint = "Full filesystem access enabled" if ALLOW_ANY_PATH \
                   else "Tip: start server with --allow-any-path to browse anywhere"
-    return render_template_string(PAGE, root=BROWSE_ROOT, footer_note=footer_note, browse_hint=browse_hint)
+    page = PAGE_TEMPLATE.render(root=BROWSE_ROOT, footer_note=footer_note, browse_hint=browse_hint)
+    # The page only depends on startup configuration, so browsers may reuse it briefly
+    return page, {"Cache-Control": "public, max-age=300"}
 
 
 @app.route("/api/ls")
 def api_ls():
     raw = request.args.get("path", BROWSE_ROOT)
     path = Path(raw).expanduser().resolve(strict=False)
+    try:
+        offset = max(0, int(request.args.get("offset", "0")))
+        limit = max(1, int(request.args.get("limit", str(LS_PAGE_SIZE))))
+    except ValueError:
+        abort(400, description="Invalid offset or limit")
 
     if not within_root(path):
         abort(403, description="Path outside of allowed root")
-    if not path.exists() or not path.is_dir():
+    if not path.is_dir():
         abort(400, description="Not a directory")
 
-    # Breadcrumbs & parent
+    # Breadcrumbs & parent (`path` and the roots below are already resolved)
     if ALLOW_ANY_PATH:
         root = system_root_for(path)
         current = root
         crumbs = [{"label": str(root), "path": str(root)}]
-        rel_parts = path.resolve(strict=False).parts[len(root.resolve(strict=False).parts):]
+        rel_parts = path.parts[len(root.parts):]
         for part in rel_parts:
             current = current.joinpath(part)
             crumbs.append({"label": part, "path": str(current)})
         parent = str(path.parent) if path != root else None
     else:
-        base = Path(BROWSE_ROOT).resolve(strict=False)
+        base = Path(BROWSE_ROOT_RESOLVED)
         crumbs = [{"label": str(base), "path": str(base)}]
         try:
             rel = path.relative_to(base)
@@ -370,16 +847,23 @@ def api_ls():
 
     dirs, files = [], []
     try:
-        entries = sorted(path.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower()))
+        with os.scandir(path) as it:
+            entries = [(not entry_is_dir(e), e.name.lower(), e) for e in it]
     except PermissionError:
         abort(403, description="Permission denied")
-    for entry in entries:
+    # Only the entries up to the end of the requested page need ordering
+    total = len(entries)
+    page = heapq.nsmallest(offset + limit, entries, key=lambda t: t[:2])[offset:]
+    next_offset = offset + limit if offset + limit < total else None
+    for is_file, _, entry in page:
         try:
-            if entry.is_dir():
-                if within_root(entry):
-                    dirs.append({"name": entry.name, "path": str(entry.resolve(strict=False))})
+            real_path = entry_real_path(entry)
+            if not is_file:
+                # `path` is resolved and in-root, so only symlinked children can escape it
+                if real_path == entry.path or within_root(Path(real_path)):
+                    dirs.append({"name": entry.name, "path": real_path})
             else:
-                files.append({"name": entry.name, "path": str(entry.resolve(strict=False))})
+                files.append({"name": entry.name, "path": real_path})
         except Exception:
             continue
 
@@ -388,13 +872,17 @@ def api_ls():
         "parent": parent,
         "breadcrumb": crumbs,
         "dirs": dirs,
-        "files": files
+        "files": files,
+        "total": total,
+        "offset": offset,
+        "next_offset": next_offset
     })
 
 
 @app.route("/api/set_vault", methods=["POST"])
 def api_set_vault():
-    global INDEX, DOCS, VAULT_PATH
+    global TITLES, TITLES_LOWER, PATHS, REL_PATHS, STAMPS, HASHES, CONTENTS_LOWER, URLS, TOKENS, VOCAB, VAULT_PATH
+    global INDEX_DIRTY, INDEX_SAVED_AT, INDEX_GENERATION
     data = request.get_json(force=True, silent=True) or {}
     req_path = data.get("path", "")
 
@@ -407,31 +895,66 @@ def api_set_vault():
     if not path.is_dir():
         abort(400, description="Not a directory")
 
-    VAULT_PATH = str(path)  # container-visible absolute
-    INDEX, DOCS = crawl_obsidian_vault(VAULT_PATH)
-    return jsonify({"ok": True, "count": len(DOCS), "vault": VAULT_PATH})
+    vault_path = str(path)  # container-visible absolute
+    with CRAWL_LOCK:
+        flush_index_cache(force=True)  # keep the current vault's unsaved edits
+        cached = load_index_cache(vault_path)
+        columns, tokens, changed = crawl_obsidian_vault(vault_path, cached)
+        with INDEX_LOCK:
+            TITLES, TITLES_LOWER, PATHS, REL_PATHS, STAMPS, HASHES, CONTENTS_LOWER, URLS = columns
+            TOKENS, VAULT_PATH = tokens, vault_path
+            VOCAB = None
+            INDEX_GENERATION += 1
+            cache.clear()  # frees the old generation's hits; they can no longer be looked up
+        count = sum(path is not None for path in PATHS)
+        if changed or cached is None:
+            save_index_cache(vault_path, columns, tokens)
+        INDEX_DIRTY, INDEX_SAVED_AT = False, time.monotonic()
+        start_reindexer()
+    return jsonify({"ok": True, "count": count, "vault": vault_path})
+
+
+def search_cache_key():
+    """
+    Cache key for /api/search. Flask-Caching stores a response after the view has released
+    INDEX_LOCK, so a search racing a re-index could store hits whose doc ids belong to the
+    previous index; keying on the generation read before the search means such late entries
+    are filed under a generation no later request asks for.
+    """
+    return f"search/{INDEX_GENERATION}?{request.query_string.decode('latin-1')}"
 
 
 @app.route("/api/search")
+@cache.cached(make_cache_key=search_cache_key)
 def api_search():
-    q = (request.args.get("q") or "").strip().lower()
-    if not q:
+    terms = query_terms((request.args.get("q") or "").lower())
+    if not terms:
         return jsonify([])
     results = []
-    for doc_id, text in INDEX:
-        meta = DOCS.get(doc_id)
-        if not meta:
-            continue
-        hay = (text or "").lower()
-        title = (meta["title"] or "").lower()
-        if q in hay or q in title:
-            results.append({
-                "id": doc_id,
-                "title": meta["title"],
-                "rel_path": meta["rel_path"],
-                "abs_path": meta["path"],                 # container-visible path
-                "obsidian_url": build_obsidian_url(meta)  # deep link to host/vault
-            })
+    with INDEX_LOCK:
+        # Every term must match, so intersect each term's candidates before touching any note
+        candidates = None
+        for term in terms:
+            term_docs = candidate_docs(term)
+            if term_docs is not None:
+                candidates = term_docs if candidates is None else candidates & term_docs
+            if candidates is not None and not candidates:
+                break
+        doc_ids = range(len(PATHS)) if candidates is None else sorted(candidates)
+        needles = [(term.encode("utf-8"), term) for term in terms]
+        for doc_id in doc_ids:
+            path = PATHS[doc_id]
+            if path is None:
+                continue
+            content_lower, title_lower = CONTENTS_LOWER[doc_id], TITLES_LOWER[doc_id]
+            if all(term_bytes in content_lower or term in title_lower for term_bytes, term in needles):
+                results.append({
+                    "id": doc_id,
+                    "title": TITLES[doc_id],
+                    "rel_path": REL_PATHS[doc_id],
+                    "abs_path": path,              # container-visible path
+                    "obsidian_url": URLS[doc_id]   # deep link to host/vault
+                })
     return jsonify(results)
 
 
@@ -442,15 +965,32 @@ def open_doc():
         doc_id = int(request.args.get("doc_id", "-1"))
     except ValueError:
         abort(400, description="Invalid doc id")
-    meta = DOCS.get(doc_id)
-    if not meta:
+    with INDEX_LOCK:
+        if not 0 <= doc_id < len(PATHS) or PATHS[doc_id] is None:
+            abort(404, description="Document not found")
+        title, path, rel_path = TITLES[doc_id], PATHS[doc_id], REL_PATHS[doc_id]
+    try:
+        note = open(path, "rb")
+    except OSError:
         abort(404, description="Document not found")
-    return f"""
+    return Response(stream_note(title, rel_path, note), mimetype="text/html")
+
+
+def stream_note(title: str, rel_path: str, note):
+    """Yield the /open page for a note, reading and escaping the file in chunks."""
+    yield f"""
     <div style="padding:20px; font-family:system-ui,Segoe UI,Arial,sans-serif; color:#e6eef8; background:#0b1020">
       <a href="/" style="color:#9bd3ff; text-decoration:none">← Back</a>
-      <h2>{meta['title']}</h2>
-      <div style="color:#9aa4b2; font-size:12px; margin-bottom:10px">{meta['rel_path']}</div>
-      <pre style="white-space:pre-wrap; border:1px solid #1e2a44; background:#0f162d; padding:14px; border-radius:12px; overflow:auto">{meta['content']}</pre>
+      <h2>{html.escape(title)}</h2>
+      <div style="color:#9aa4b2; font-size:12px; margin-bottom:10px">{html.escape(rel_path)}</div>
+      <pre style="white-space:pre-wrap; border:1px solid #1e2a44; background:#0f162d; padding:14px; border-radius:12px; overflow:auto">"""
+    # Incremental decoder so multi-byte characters split across chunks survive
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    with note:
+        while chunk := note.read(OPEN_CHUNK_SIZE):
+            yield html.escape(decoder.decode(chunk), quote=False)
+    yield html.escape(decoder.decode(b"", final=True), quote=False)
+    yield """</pre>
     </div>
     """
 
@@ -470,6 +1010,10 @@ if __name__ == "__main__":
                         help="Container path prefix (e.g., /vault) to translate to host path.")
     parser.add_argument("--host-prefix", default=OBSIDIAN_HOST_PREFIX,
                         help="Host path prefix (e.g., /Users/you/ObsidianVault) for deep-link mapping.")
+    parser.add_argument("--cache-dir", default=INDEX_CACHE_DIR,
+                        help="Folder where vault indexes are persisted between runs (empty string disables).")
+    parser.add_argument("--reindex-interval", type=float, default=REINDEX_INTERVAL,
+                        help="Seconds between background checks for changed notes (0 disables).")
     args = parser.parse_args()
 
     # Assign module-level variables from CLI where provided
@@ -478,9 +1022,12 @@ if __name__ == "__main__":
     OBSIDIAN_VAULT_NAME = args.vault_name or OBSIDIAN_VAULT_NAME
     OBSIDIAN_CONTAINER_PREFIX = os.path.normpath(args.container_prefix or OBSIDIAN_CONTAINER_PREFIX)
     OBSIDIAN_HOST_PREFIX = os.path.normpath(args.host_prefix or OBSIDIAN_HOST_PREFIX)
+    INDEX_CACHE_DIR = args.cache_dir
+    REINDEX_INTERVAL = args.reindex_interval
 
     # Ensure starting folder exists
     os.makedirs(BROWSE_ROOT, exist_ok=True)
+    BROWSE_ROOT_RESOLVED = str(Path(BROWSE_ROOT).resolve(strict=False))
 
     mode = "UNSAFE: any path" if ALLOW_ANY_PATH else f"root-limited: {BROWSE_ROOT}"
     print(f"[info] Browse mode: {mode}")
@@ -488,4 +1035,7 @@ if __name__ == "__main__":
     if not OBSIDIAN_VAULT_NAME:
         print(f"[info] Path mapping: {OBSIDIAN_CONTAINER_PREFIX}  ->  {OBSIDIAN_HOST_PREFIX or '(no host prefix; using container path)'}")
 
-    app.run(host=args.host, port=args.port, debug=True)
+    # `docker stop` sends SIGTERM; exit normally so atexit flushes unsaved index edits
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    # No reloader: its parent process SIGKILLs the server on SIGTERM, which would skip the exit flush
+    app.run(host=args.host, port=args.port, debug=True, use_reloader=False, threaded=True)